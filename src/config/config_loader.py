@@ -3,41 +3,64 @@ Configuration loader for Global Consciousness Quantum Data project
 Centralized configuration management using YAML
 """
 
-import yaml
+import json
 import os
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# JSON snapshot written next to the YAML file to skip YAML parsing on warm starts
+SNAPSHOT_SUFFIX = ".cache.json"
+
 
 class Config:
     """Configuration loader and manager"""
 
     _instance = None
+    _lock = threading.Lock()
     _config = None
+    _flat: Dict[str, Any] = {}
 
     def __new__(cls):
+        # Double-checked so repeat calls skip the lock and only one thread loads
         if cls._instance is None:
-            cls._instance = super(Config, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(Config, cls).__new__(cls)
+                    instance.load_config()
+                    cls._instance = instance
         return cls._instance
 
-    def __init__(self):
-        if self._config is None:
-            self.load_config()
-
     def load_config(self, config_path: str = "src/config/config.yaml"):
-        """Load configuration from YAML file"""
+        """Load configuration from YAML file, or from its JSON snapshot if fresh"""
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Configuration file {config_path} not found")
 
+        # Taken before reading, so a YAML edited mid-load never matches the snapshot
+        source = self._source_signature(config_path)
+        snapshot_path = config_path + SNAPSHOT_SUFFIX
+        snapshot = self._read_snapshot(source, snapshot_path)
+        if snapshot is not None:
+            self._config = snapshot
+            self._flat = self._flatten(snapshot)
+            logger.info(f"✅ Configuration loaded from snapshot {snapshot_path}")
+            return
+
         try:
-            with open(config_path, "r", encoding="utf-8") as file:
-                self._config = yaml.safe_load(file)
+            # Imported here so warm starts served from the snapshot never load PyYAML
+            import yaml
+
+            # Prefer the libyaml-backed loader when PyYAML was built with it
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            with open(config_path, "rb") as file:
+                self._config = yaml.load(file, Loader=loader)
 
             if self._config is None:
                 raise ValueError("Configuration file is empty")
 
+            self._flat = self._flatten(self._config)
             logger.info(f"✅ Configuration loaded from {config_path}")
 
         except Exception as e:
@@ -46,6 +69,56 @@ class Config:
                 f"Configuration loading failed: {e}. All configuration must be defined in {config_path}"
             )
 
+        self._write_snapshot(snapshot_path, source)
+
+    @staticmethod
+    def _flatten(node: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+        """Index every section and value by its dotted key path"""
+        flat = {}
+        for key, value in node.items():
+            key_path = f"{prefix}{key}"
+            flat[key_path] = value
+            if isinstance(value, dict):
+                flat.update(Config._flatten(value, f"{key_path}."))
+        return flat
+
+    @staticmethod
+    def _source_signature(config_path: str) -> Dict[str, int]:
+        """Identify the YAML file's current contents by modification time and size"""
+        stat = os.stat(config_path)
+        return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+    @staticmethod
+    def _read_snapshot(source: Dict[str, int], snapshot_path: str) -> Optional[Dict]:
+        """Return the snapshotted configuration if it was taken from this exact YAML file"""
+        # Exact match rather than "newer than": deploys that preserve mtimes
+        # (rsync -a, cp -p, tar) can leave an old snapshot newer than a new YAML
+        try:
+            with open(snapshot_path, "rb") as file:
+                snapshot = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(snapshot, dict) or snapshot.get("source") != source:
+            return None
+        config = snapshot.get("config")
+        return config if isinstance(config, dict) else None
+
+    def _write_snapshot(self, snapshot_path: str, source: Dict[str, int]):
+        """Atomically write the loaded configuration as a JSON snapshot"""
+        tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump({"source": source, "config": self._config}, file)
+            os.replace(tmp_path, snapshot_path)
+        except (OSError, TypeError, ValueError) as e:
+            # Snapshot is only an optimization; fall back to YAML next time
+            logger.warning(f"⚠️ Could not write configuration snapshot: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
     def get(self, key_path: str, default: Any = None) -> Any:
         """
         Get configuration value using dot notation
@@ -60,17 +133,12 @@ class Config:
         if self._config is None:
             raise RuntimeError("Configuration not loaded. Call load_config() first.")
 
-        keys = key_path.split(".")
-        value = self._config
-
-        try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            if default is not None:
-                return default
-            raise KeyError(f"Configuration key '{key_path}' not found")
+        flat = self._flat
+        if key_path in flat:
+            return flat[key_path]
+        if default is not None:
+            return default
+        raise KeyError(f"Configuration key '{key_path}' not found")
 
     def get_section(self, section: str) -> Dict[str, Any]:
         """Get entire configuration section"""
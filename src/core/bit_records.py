@@ -0,0 +1,50 @@
+"""
+Binary bit file format shared by quantum_proxy.py (writer) and quantum_uploader.py (reader)
+
+A file is a sequence of records, one per run of bits that share a fetch timestamp.
+Each record is a little-endian header (Unix timestamp in microseconds as uint64,
+bit count as uint32) followed by the bits packed 8 per byte, most significant bit first.
+"""
+
+import struct
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+BIT_RECORD_HEADER = struct.Struct("<QI")
+BIT_FILE_SUFFIX = ".bin"
+
+
+def encode_bit_records(records: Iterable[Tuple[int, bytes]]) -> bytes:
+    """Encode (timestamp_us, bits as one 0/1 byte per bit) records into file bytes"""
+    parts = []
+    for timestamp_us, bits in records:
+        parts.append(BIT_RECORD_HEADER.pack(timestamp_us, len(bits)))
+        parts.append(np.packbits(np.frombuffer(bits, dtype=np.uint8)).tobytes())
+    return b"".join(parts)
+
+
+def decode_bit_records(data: bytes) -> List[Tuple[int, bytes]]:
+    """
+    Decode file bytes into (timestamp_us, bits as one 0/1 byte per bit) records
+
+    Raises:
+        ValueError: When the data ends partway through a record
+    """
+    records = []
+    offset = 0
+    while offset < len(data):
+        if offset + BIT_RECORD_HEADER.size > len(data):
+            raise ValueError(f"Truncated bit record header at byte {offset}")
+        timestamp_us, count = BIT_RECORD_HEADER.unpack_from(data, offset)
+        offset += BIT_RECORD_HEADER.size
+        packed_size = (count + 7) // 8
+        if offset + packed_size > len(data):
+            raise ValueError(
+                f"Truncated bit record at byte {offset}: expected {packed_size} bytes "
+                f"for {count} bits, got {len(data) - offset}"
+            )
+        packed = np.frombuffer(data, dtype=np.uint8, count=packed_size, offset=offset)
+        offset += packed_size
+        records.append((timestamp_us, np.unpackbits(packed, count=count).tobytes()))
+    return records
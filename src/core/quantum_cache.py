@@ -1,11 +1,16 @@
 import requests
+from requests.adapters import HTTPAdapter
+import random
 import time
 import threading
 import logging
+import math
 import os
-from typing import List, Optional, Dict, Any
+import numpy as np
+import orjson
+from collections import deque
+from typing import Deque, List, Optional, Dict, Any, Tuple
 from dotenv import load_dotenv
-from scipy.stats import binomtest
 import humanize
 from src.config.config_loader import get_quantum_cache_config, get_config
 
@@ -16,6 +21,12 @@ load_dotenv(override=True)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Every bit of each uint16 the API returns is used, so one JSON number carries 16 bits
+BITS_PER_API_VALUE = 16
+# From this many bits on, bit_stats p-values use the normal approximation instead
+# of scipy's exact binomial test (they agree to within 1e-4)
+NORMAL_APPROX_MIN_SAMPLES = 1000
+
 
 class QuantumDataException(Exception):
     """Quantum data acquisition exception"""
@@ -28,8 +39,8 @@ class QuantumCache:
     Quantum random number cache class
 
     Features:
-    - Double buffering mechanism: current buffer and preload buffer
-    - Prefetching: fetch next batch of data in advance
+    - Multi-buffering: current buffer plus a queue of preloaded batches
+    - Prefetching: fetch upcoming batches in advance
     - Smart retry: exponential backoff retry strategy
     - Strict: explicit error on failure
     - Data source: quantum random number generator
@@ -42,6 +53,7 @@ class QuantumCache:
         api_key: Optional[str] = None,
         request_timeout: Optional[int] = None,
         max_retries: Optional[int] = None,
+        prefetch_depth: Optional[int] = None,
     ):
         """
         Initialize quantum cache
@@ -52,6 +64,7 @@ class QuantumCache:
             api_key: API key for quantum service (if None, loads from QUANTUM_API_KEY env var)
             request_timeout: Request timeout duration (if None, uses config)
             max_retries: Maximum number of retries (if None, uses config)
+            prefetch_depth: Number of fetched batches to keep queued ahead (if None, uses config)
         """
         # Load configuration
         cache_config = get_quantum_cache_config()
@@ -62,6 +75,7 @@ class QuantumCache:
         )
         self.request_timeout = request_timeout or cache_config["request_timeout"]
         self.max_retries = max_retries or cache_config["max_retries"]
+        self.prefetch_depth = prefetch_depth or cache_config["prefetch_depth"]
 
         self.quantum_api_url = "https://api.quantumnumbers.anu.edu.au/"
 
@@ -78,37 +92,45 @@ class QuantumCache:
                 "API key is required. Please set QUANTUM_API_KEY environment variable or pass api_key parameter."
             )
 
-        # Double buffering with timestamps
-        self.current_buffer: List[int] = []
+        # Current buffer plus a queue of prefetched (bits, fetch timestamp) batches
+        self.current_buffer: bytes = b""
         self.current_buffer_timestamp: Optional[float] = None
-        self.next_buffer: List[int] = []
-        self.next_buffer_timestamp: Optional[float] = None
+        self.next_buffers: Deque[Tuple[bytes, float]] = deque()
+
+        # Reuse one keep-alive connection to the quantum API across fetches
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        # Request headers and params never change, so build them once
+        self.session.headers.update(self._get_api_headers())
+        self._api_params = self._get_api_params()
 
         # State tracking
         self.current_index = 0
+        self._remaining = 0  # Unread bits in current_buffer
         self.last_fetch_time = 0
         self.is_prefetching = False
-        self.fetch_lock = threading.Lock()
+        self.prefetch_event = threading.Event()
         self.prefetch_thread: Optional[threading.Thread] = None
+        # Serializes bit consumption across request threads (gunicorn gthread),
+        # so no two requests are served the same bits. Held only for index
+        # updates; fetching happens on the prefetch worker outside it.
+        self.serve_lock = threading.Lock()
 
         # Statistics
         self.stats = {
             "total_requests": 0,
             "successful_requests": 0,
             "failed_requests": 0,
-            "cache_hits": 0,
             "prefetch_count": 0,
             "rate_limit_hits": 0,
             "timeout_errors": 0,
             "network_errors": 0,
         }
-
-        # Bit statistics for distribution analysis
-        self.bit_stats = {
-            "count_0": 0,
-            "count_1": 0,
-            "total_bits": 0,
-        }
+        # Bumped on every bit served, so kept out of the stats dict. They also
+        # carry the bit distribution: every hit is one served bit, and zeros
+        # are derived as hits - ones when statistics are requested.
+        self._cache_hits = 0
+        self._ones_served = 0
 
         # Record startup time for runtime calculation
         self.startup_time = time.time()
@@ -118,6 +140,12 @@ class QuantumCache:
         # Initialize cache
         self._initial_load()
 
+        # Single background worker reused for every prefetch
+        self.prefetch_thread = threading.Thread(
+            target=self._prefetch_worker, daemon=True
+        )
+        self.prefetch_thread.start()
+
     def _get_api_headers(self) -> Dict[str, str]:
         """Get headers for API format"""
         if not self.api_key:
@@ -126,19 +154,18 @@ class QuantumCache:
 
     def _get_api_params(self) -> Dict[str, Any]:
         """Get parameters for format"""
-        return {"length": self.cache_size, "type": "uint8"}
+        # Enough uint16 values to cover cache_size bits
+        length = -(-self.cache_size // BITS_PER_API_VALUE)
+        return {"length": length, "type": "uint16"}
 
-    def _fetch_raw_data(self) -> Optional[tuple[List[int], float]]:
+    def _fetch_raw_data(self) -> Optional[tuple[bytes, float]]:
         """
         Fetch raw data from quantum API - absolutely no pseudo-random data used
 
         Returns:
-            Returns tuple of (quantum data list, fetch timestamp) on success, None on failure
+            Returns tuple of (quantum bits, one per byte, and fetch timestamp) on success, None on failure
         """
-        start_time = time.time()
-
-        headers = self._get_api_headers()
-        params = self._get_api_params()
+        start_time = time.perf_counter()  # Monotonic, only used for elapsed-time logs
 
         self.stats["total_requests"] += 1
 
@@ -149,26 +176,27 @@ class QuantumCache:
                     f"Fetching quantum data from ANU Quantum API (attempt {attempt + 1})"
                 )
 
-                response = requests.get(
+                response = self.session.get(
                     self.quantum_api_url,
-                    headers=headers,
-                    params=params,
+                    params=self._api_params,
                     timeout=self.request_timeout,
                 )
 
                 if response.status_code == 200:
                     # Record the exact timestamp when API responded with data
                     fetch_timestamp = time.time()
-                    data = response.json()
+                    data = orjson.loads(response.content)
 
                     # Check for success in API format
                     if data.get("success") is True and "data" in data:
                         raw_data = data["data"]
-                        # Convert directly to random bits
-                        bits = [x % 2 for x in raw_data]
+                        # Unpack every uint16 into its 16 bits (MSB first), one bit per byte
+                        words = np.array(raw_data, dtype=">u2")
+                        bits = np.unpackbits(words.view(np.uint8)).tobytes()
+                        bits = bits[: self.cache_size]
 
                         self.stats["successful_requests"] += 1
-                        elapsed_time = time.time() - start_time
+                        elapsed_time = time.perf_counter() - start_time
                         logger.info(
                             f"✅ Successfully fetched {len(bits)} quantum bits in {elapsed_time:.2f}s"
                         )
@@ -179,9 +207,12 @@ class QuantumCache:
                         )
 
                 elif response.status_code == 429:
-                    rate_limit_wait = get_config("quantum_cache.rate_limit_wait")
+                    # Jittered so clients limited together do not retry together
+                    rate_limit_wait = random.uniform(0.5, 1.0) * get_config(
+                        "quantum_cache.rate_limit_wait"
+                    )
                     logger.warning(
-                        f"Rate limit exceeded, waiting {rate_limit_wait}s..."
+                        f"Rate limit exceeded, waiting {rate_limit_wait:.1f}s..."
                     )
                     self.stats["rate_limit_hits"] += 1
                     time.sleep(rate_limit_wait)  # Wait before retry
@@ -214,16 +245,16 @@ class QuantumCache:
             except Exception as e:
                 logger.error(f"Unexpected error (attempt {attempt + 1}): {e}")
 
-            # Wait before retry (exponential backoff)
+            # Wait before retry (exponential backoff with full jitter)
             if attempt < self.max_retries - 1:
                 max_backoff = get_config("quantum_cache.exponential_backoff_max")
-                wait_time = min(2**attempt, max_backoff)  # Maximum wait from config
-                logger.info(f"Waiting {wait_time}s before retry...")
+                wait_time = random.uniform(0, min(2**attempt, max_backoff))
+                logger.info(f"Waiting {wait_time:.1f}s before retry...")
                 time.sleep(wait_time)
 
         # All retries failed
         self.stats["failed_requests"] += 1
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         logger.error(f"❌ All fetch attempts failed after {elapsed_time:.2f}s")
         return None
 
@@ -235,66 +266,83 @@ class QuantumCache:
             data, fetch_timestamp = result
             self.current_buffer = data
             self.current_buffer_timestamp = fetch_timestamp
+            self._remaining = len(data)
             self.last_fetch_time = fetch_timestamp
             logger.info(
                 f"✅ Initial load complete: {len(self.current_buffer)} quantum bits loaded"
             )
         else:
             logger.error("❌ CRITICAL: Failed to load initial quantum data")
-            self.current_buffer = []
+            self.current_buffer = b""
             self.current_buffer_timestamp = None
             raise QuantumDataException("Failed to load initial quantum data.")
 
     def _prefetch_data(self):
-        """Prefetch next batch of quantum data in background thread"""
+        """Wake the background prefetch worker to fetch the next batch"""
         if self.is_prefetching:
             return
 
-        def prefetch_worker():
-            self.is_prefetching = True
-            self.stats["prefetch_count"] += 1
+        self.is_prefetching = True
+        self.prefetch_event.set()
+
+    def _prefetch_worker(self):
+        """Long-lived worker that fills the prefetch queue each time it is woken"""
+        while True:
+            self.prefetch_event.wait()
+            self.prefetch_event.clear()
 
             try:
-                logger.info("🔄 Starting quantum data prefetch...")
-                result = self._fetch_raw_data()
-
-                with self.fetch_lock:
-                    if result:
-                        data, fetch_timestamp = result
-                        self.next_buffer = data
-                        self.next_buffer_timestamp = fetch_timestamp
-                        logger.info(
-                            f"✅ Prefetch complete: {len(data)} quantum bits ready"
-                        )
-                    else:
+                # Keep fetching until prefetch_depth batches are queued. deque
+                # append/popleft are atomic, so the consumer takes batches
+                # without a lock.
+                while len(self.next_buffers) < self.prefetch_depth:
+                    self.stats["prefetch_count"] += 1
+                    logger.info("🔄 Starting quantum data prefetch...")
+                    result = self._fetch_raw_data()
+
+                    if not result:
                         logger.error("❌ Prefetch failed - maintaining current buffer")
-                        self.next_buffer = []
-                        self.next_buffer_timestamp = None
+                        break
+
+                    self.next_buffers.append(result)
+                    logger.info(
+                        f"✅ Prefetch complete: {len(result[0])} quantum bits ready "
+                        f"({len(self.next_buffers)} batches queued)"
+                    )
 
             except Exception as e:
                 logger.error(f"Prefetch error: {e}")
-                with self.fetch_lock:
-                    self.next_buffer = []
-                    self.next_buffer_timestamp = None
             finally:
                 self.is_prefetching = False
 
-        self.prefetch_thread = threading.Thread(target=prefetch_worker, daemon=True)
-        self.prefetch_thread.start()
-
     def _should_prefetch(self) -> bool:
         """Check if prefetching should be triggered"""
-        remaining = len(self.current_buffer) - self.current_index
         return (
-            remaining <= self.prefetch_threshold
+            self._remaining <= self.prefetch_threshold
             and not self.is_prefetching
-            and len(self.next_buffer) == 0
+            and len(self.next_buffers) < self.prefetch_depth
         )
 
     def _should_switch_buffer(self) -> bool:
         """Check if buffer switching should occur"""
-        remaining = len(self.current_buffer) - self.current_index
-        return remaining <= 0 and len(self.next_buffer) > 0
+        return self._remaining <= 0 and bool(self.next_buffers)
+
+    def _prepare_buffer(self):
+        """Start prefetching and switch to the next buffer when needed"""
+        # Start prefetching if needed
+        if self._should_prefetch():
+            self._prefetch_data()
+
+        # Switch buffer if needed
+        if self._should_switch_buffer():
+            self.current_buffer, self.current_buffer_timestamp = (
+                self.next_buffers.popleft()
+            )
+            self.current_index = 0
+            self._remaining = len(self.current_buffer)
+            logger.info(
+                f"🔄 Buffer switched: {len(self.current_buffer)} quantum bits available"
+            )
 
     def get_bit(self) -> int:
         """
@@ -306,40 +354,8 @@ class QuantumCache:
         Raises:
             QuantumDataException: When quantum data is not available
         """
-        # Start prefetching if needed
-        if self._should_prefetch():
-            self._prefetch_data()
-
-        # Switch buffer if needed
-        if self._should_switch_buffer():
-            with self.fetch_lock:
-                self.current_buffer = self.next_buffer[:]
-                self.current_buffer_timestamp = self.next_buffer_timestamp
-                self.next_buffer = []
-                self.next_buffer_timestamp = None
-                self.current_index = 0
-                logger.info(
-                    f"🔄 Buffer switched: {len(self.current_buffer)} quantum bits available"
-                )
-
-        # Check if we have data
-        if self.current_index >= len(self.current_buffer):
-            logger.error("❌ CRITICAL: No quantum data available")
-            raise QuantumDataException("No quantum data available.")
-
-        # Return quantum bit
-        bit = self.current_buffer[self.current_index]
-        self.current_index += 1
-        self.stats["cache_hits"] += 1
-
-        # Update bit statistics
-        if bit == 0:
-            self.bit_stats["count_0"] += 1
-        else:
-            self.bit_stats["count_1"] += 1
-        self.bit_stats["total_bits"] += 1
-
-        return bit
+        with self.serve_lock:
+            return self._take_bit()
 
     def get_bit_with_timestamp(self) -> tuple[int, float]:
         """
@@ -351,8 +367,34 @@ class QuantumCache:
         Raises:
             QuantumDataException: When quantum data is not available
         """
-        bit = self.get_bit()
-        return bit, self.current_buffer_timestamp or time.time()
+        with self.serve_lock:
+            # Read the timestamp under the lock so it belongs to the bit's buffer
+            bit = self._take_bit()
+            return bit, self.current_buffer_timestamp or time.time()
+
+    def _take_bit(self) -> int:
+        """Consume the next bit (must be called with serve_lock held)"""
+        # Above the prefetch threshold neither a prefetch nor a switch can be
+        # due, so skip both checks on the common path
+        remaining = self._remaining
+        if remaining <= self.prefetch_threshold:
+            self._prepare_buffer()
+            remaining = self._remaining
+
+            # Check if we have data
+            if remaining <= 0:
+                logger.error("❌ CRITICAL: No quantum data available")
+                raise QuantumDataException("No quantum data available.")
+
+        # Return quantum bit
+        index = self.current_index
+        bit = self.current_buffer[index]
+        self.current_index = index + 1
+        self._remaining = remaining - 1
+        self._cache_hits += 1
+        self._ones_served += bit
+
+        return bit
 
     def get_bits(self, count: int) -> List[int]:
         """
@@ -364,6 +406,25 @@ class QuantumCache:
         Returns:
             List of quantum random bits
 
+        Raises:
+            QuantumDataException: When quantum data is not available or count > MAX_API_BITS
+        """
+        runs = self.get_bits_with_timestamps(count)
+        if len(runs) == 1:
+            return list(runs[0][0])
+        return [bit for chunk, _ in runs for bit in chunk]
+
+    def get_bits_with_timestamps(self, count: int) -> List[Tuple[bytes, float]]:
+        """
+        Get multiple quantum bits grouped by the buffer they came from
+
+        Args:
+            count: Number of bits to get
+
+        Returns:
+            List of (quantum bits, one 0/1 byte each, fetch timestamp) runs in
+            serving order; a single run unless the request spans a buffer switch
+
         Raises:
             QuantumDataException: When quantum data is not available or count > MAX_API_BITS
         """
@@ -374,20 +435,63 @@ class QuantumCache:
             raise QuantumDataException(
                 f"Requested bits ({count}) exceed API maximum ({max_api_bits}) per request."
             )
-        bits = []
-        for _ in range(count):
-            bits.append(self.get_bit())
 
-        return bits
+        with self.serve_lock:
+            # Fast path: the whole request fits in the current buffer
+            remaining = self._remaining
+            if count <= remaining:
+                start = self.current_index
+                chunk = self.current_buffer[start : start + count]
+                self.current_index = start + count
+                self._remaining = remaining - count
+                self._record_served(chunk)
+                runs = [(chunk, self.current_buffer_timestamp or time.time())]
+
+                if self._should_prefetch():
+                    self._prefetch_data()
+                return runs
+
+            # Slow path: the request spans a buffer switch
+            runs = []
+            taken = 0
+            while taken < count:
+                self._prepare_buffer()
+
+                # Take as many bits as the current buffer can provide in one slice
+                available = self._remaining
+                if available <= 0:
+                    logger.error("❌ CRITICAL: No quantum data available")
+                    raise QuantumDataException("No quantum data available.")
+
+                start = self.current_index
+                take = min(count - taken, available)
+                chunk = self.current_buffer[start : start + take]
+                self.current_index = start + take
+                self._remaining = available - take
+                self._record_served(chunk)
+                runs.append((chunk, self.current_buffer_timestamp or time.time()))
+                taken += take
+
+            # Keep the prefetch ahead of the consumer after a large pull
+            if self._should_prefetch():
+                self._prefetch_data()
+
+            return runs
+
+    def _record_served(self, chunk: bytes):
+        """Update hit and bit distribution counters for a served slice"""
+        self._cache_hits += len(chunk)
+        self._ones_served += chunk.count(1)
 
     def get_status(self) -> Dict[str, Any]:
         """Get cache status"""
-        remaining_bits = len(self.current_buffer) - self.current_index
-        next_buffer_bits = len(self.next_buffer)
+        remaining_bits = self._remaining
+        next_buffer_bits = sum(len(bits) for bits, _ in list(self.next_buffers))
 
         return {
             "remaining_bits": remaining_bits,
             "next_buffer_bits": next_buffer_bits,
+            "queued_batches": len(self.next_buffers),
             "is_prefetching": self.is_prefetching,
             "api_url": self.quantum_api_url,
             "last_fetch_time": self.last_fetch_time,
@@ -397,19 +501,16 @@ class QuantumCache:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistical information"""
-        return self.stats.copy()
+        return {**self.stats, "cache_hits": self._cache_hits}
 
     def reset_stats(self):
         """Reset statistical counters"""
         for key in self.stats:
             self.stats[key] = 0
+        self._cache_hits = 0
 
         # Reset bit statistics
-        self.bit_stats = {
-            "count_0": 0,
-            "count_1": 0,
-            "total_bits": 0,
-        }
+        self._ones_served = 0
 
         logger.info("📊 Statistics reset")
 
@@ -421,9 +522,9 @@ class QuantumCache:
             Dictionary containing bit statistics including p-value analysis
         """
 
-        sample_size = self.bit_stats["total_bits"]
-        count_0 = self.bit_stats["count_0"]
-        count_1 = self.bit_stats["count_1"]
+        sample_size = self._cache_hits
+        count_1 = self._ones_served
+        count_0 = sample_size - count_1
 
         if sample_size == 0:
             return {
@@ -446,7 +547,17 @@ class QuantumCache:
         # We test against null hypothesis that p=0.5 (fair coin)
         coin_fairness = get_config("quantum_cache.coin_fairness_threshold")
         significance_level = get_config("quantum_cache.statistical_significance")
-        p_value = binomtest(count_1, sample_size, coin_fairness).pvalue
+        if sample_size >= NORMAL_APPROX_MIN_SAMPLES:
+            # Two-sided normal approximation with continuity correction, O(1)
+            mean = sample_size * coin_fairness
+            std = math.sqrt(sample_size * coin_fairness * (1 - coin_fairness))
+            z = max(abs(count_1 - mean) - 0.5, 0.0) / std
+            p_value = min(1.0, math.erfc(z / math.sqrt(2)))
+        else:
+            # scipy.stats is slow to import, so load it on first use
+            from scipy.stats import binomtest
+
+            p_value = binomtest(count_1, sample_size, coin_fairness).pvalue
         significant = bool(p_value < significance_level)
 
         # Calculate runtime using humanize
@@ -5,6 +5,36 @@ BITFILE=/dev/shm/qbits.txt
 TMP=/dev/shm/qbits.tmp
 ROWS=4 ; COLS=4
 API_URL="http://127.0.0.1:80/bits?count=16"
+INTERVAL_US=1000000               # 1 Hz refresh
+
+# Current time in microseconds into $now_us. EPOCHREALTIME needs bash >= 5.0;
+# older shells fall back to GNU date, at the cost of one process per tick.
+read_clock_us() {
+  if [[ -n "${EPOCHREALTIME:-}" ]]; then
+    now_us=${EPOCHREALTIME/[.,]/}
+  else
+    now_us=$(date +%s%6N)
+  fi
+}
+
+read_clock_us
+if [[ ! "$now_us" =~ ^[0-9]+$ ]]; then
+  echo "Error: need bash >= 5.0 or GNU date for microsecond timestamps" >&2
+  exit 1
+fi
+
+# Sleep until the next tick deadline so request/formatting time doesn't drift the refresh rate
+next_tick=$now_us
+wait_for_tick() {
+  next_tick=$((next_tick + INTERVAL_US))
+  read_clock_us
+  local remaining=$((next_tick - now_us))
+  if ((remaining > 0)); then
+    sleep "$((remaining / 1000000)).$(printf '%06d' $((remaining % 1000000)))"
+  else
+    next_tick=$now_us             # Fell behind: resync instead of bursting
+  fi
+}
 
 while true; do
   >"$TMP"  # clear file
@@ -18,7 +48,7 @@ while true; do
   # Check if we got valid data
   if [[ -z "$bits" ]] || [[ ${#bits} -ne 16 ]]; then
     echo "Error: Failed to get valid quantum bits from API. Response: $response" >&2
-    sleep 1
+    wait_for_tick
     continue
   fi
   
@@ -34,5 +64,5 @@ while true; do
   done
   
   mv -f "$TMP" "$BITFILE"        # Atomic replace
-  sleep 1                        # Refresh at 1 Hz
+  wait_for_tick                  # Refresh at 1 Hz
 done
\ No newline at end of file
@@ -0,0 +1,16 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Serve the quantum proxy with gunicorn instead of Flask's development server.
+# Keep a single worker: the quantum cache and bit buffer live in process memory,
+# so extra workers would each poll the ANU API and write their own data files.
+# Concurrent requests are handled by threads sharing that one cache.
+
+cd "$(dirname "$0")/../.."   # Config and data paths are relative to the repo root
+
+exec gunicorn \
+  --worker-class gthread \
+  --workers 1 \
+  --threads "${PROXY_THREADS:-16}" \
+  --bind "0.0.0.0:${PROXY_PORT:-80}" \
+  src.services.quantum_proxy:app
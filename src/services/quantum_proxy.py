@@ -1,19 +1,27 @@
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from src.core.quantum_cache import QuantumCache, QuantumDataException
+from src.core.bit_records import BIT_FILE_SUFFIX, encode_bit_records
+import atexit
 import logging
-import json
+import numpy as np
+import orjson
 import os
 import threading
 import time
+from collections import deque
 from datetime import datetime, timezone
 from threading import Lock
-from typing import Optional
+from typing import Deque, List, Optional, Tuple
 from src.config.config_loader import get_quantum_proxy_config, get_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Single-bit runs queued by add_bit, indexed by the bit value
+SINGLE_BIT_RUNS = (b"\x00", b"\x01")
+
 
 class QuantumDataBuffer:
     """
@@ -26,8 +34,22 @@ class QuantumDataBuffer:
         proxy_config = get_quantum_proxy_config()
         self.data_dir = data_dir or proxy_config["data_dir"]
         self.flush_threshold = flush_threshold or proxy_config["flush_threshold"]
-        self.buffer = []
+        # Incoming (Unix microseconds, bits as one 0/1 byte each) runs; deque
+        # appends are atomic, so request threads add bits without taking the lock
+        self.pending: Deque[Tuple[int, bytes]] = deque()
+        # Bits queued since the last drain. Updated without a lock, so it can
+        # drift by a few bits; it only decides when to wake the flush thread.
+        self.pending_bits = 0
+        # Runs of bits sharing a fetch timestamp: (Unix microseconds, one byte per bit)
+        self.buffer: List[Tuple[int, bytearray]] = []
+        self.bit_count = 0
         self.lock = Lock()
+        self.flush_interval = get_config("quantum_proxy.periodic_flush_interval")
+        self.thread_join_timeout = proxy_config["thread_join_timeout"]
+        self._stop_event = threading.Event()
+        # Set by add_bit once the threshold is reached, so the flush thread
+        # writes the file instead of the request thread
+        self._flush_event = threading.Event()
 
         # Ensure data directory exists
         os.makedirs(self.data_dir, exist_ok=True)
@@ -35,49 +57,63 @@ class QuantumDataBuffer:
         # Start periodic flush thread
         self.flush_thread = threading.Thread(target=self._periodic_flush, daemon=True)
         self.flush_thread.start()
-        flush_interval = get_config("quantum_proxy.periodic_flush_interval")
         logger.info(
-            f"🔄 Started periodic buffer flush every {flush_interval}s (threshold: {self.flush_threshold})"
+            f"🔄 Started periodic buffer flush every {self.flush_interval}s (threshold: {self.flush_threshold})"
         )
 
     def add_bit(self, bit: int, fetch_timestamp: Optional[float] = None):
         """Add a quantum bit with timestamp to the buffer"""
+        self.add_bits(SINGLE_BIT_RUNS[bit], fetch_timestamp)
+
+    def add_bits(self, bits: bytes, fetch_timestamp: Optional[float] = None):
+        """Add a run of quantum bits (one 0/1 byte each) sharing a fetch timestamp"""
+        # Use the actual fetch timestamp from quantum API, falling back to now
         if fetch_timestamp:
-            # Use the actual fetch timestamp from quantum API
-            dt = datetime.fromtimestamp(fetch_timestamp, timezone.utc)
-            timestamp = dt.isoformat().replace("+00:00", "Z")
+            timestamp_us = int(fetch_timestamp * 1_000_000)
         else:
-            # Fallback to current time if no fetch timestamp provided
-            dt = datetime.now(timezone.utc)
-            timestamp = dt.isoformat().replace("+00:00", "Z")
-
-        data_point = {"timestamp": timestamp, "bit": bit}
-
-        with self.lock:
-            self.buffer.append(data_point)
-
-            # Auto-flush if threshold reached
-            if len(self.buffer) >= self.flush_threshold:
-                self._flush_buffer()
+            timestamp_us = time.time_ns() // 1_000
+
+        self.pending.append((timestamp_us, bits))
+        self.pending_bits += len(bits)
+
+        # Auto-flush if threshold reached
+        if self.pending_bits >= self.flush_threshold and not self._flush_event.is_set():
+            self._flush_event.set()
+
+    def _drain_pending(self):
+        """Move queued bits into runs (must be called with lock held)"""
+        # Only take what is queued now; bits appended meanwhile wait for the next drain
+        self.pending_bits = 0
+        for _ in range(len(self.pending)):
+            timestamp_us, bits = self.pending.popleft()
+            # Bits from the same fetch share one run instead of a record each
+            if self.buffer and self.buffer[-1][0] == timestamp_us:
+                self.buffer[-1][1].extend(bits)
+            else:
+                self.buffer.append((timestamp_us, bytearray(bits)))
+            self.bit_count += len(bits)
 
     def _flush_buffer(self):
         """Internal method to flush buffer to file (must be called with lock held)"""
+        self._drain_pending()
         if not self.buffer:
             return
 
         try:
-            # Create filename with timestamp
-            filename = (
-                f"bits_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.json"
-            )
+            # Create filename with timestamp (microseconds keep same-second flushes apart)
+            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+            filename = f"bits_{timestamp}{BIT_FILE_SUFFIX}"
             filepath = os.path.join(self.data_dir, filename)
 
-            # Write buffer to file
-            with open(filepath, "w") as f:
-                json.dump(self.buffer, f, indent=4)
+            # Write packed bit records, then rename so readers never see a partial file
+            tmp_path = filepath + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(encode_bit_records(self.buffer))
+            os.replace(tmp_path, filepath)
 
-            logger.info(f"📝 Flushed {len(self.buffer)} bits to {filename}")
+            logger.info(f"📝 Flushed {self.bit_count} bits to {filename}")
             self.buffer = []
+            self.bit_count = 0
 
         except Exception as e:
             logger.error(f"❌ Failed to flush buffer: {e}")
@@ -89,27 +125,66 @@ class QuantumDataBuffer:
 
     def _periodic_flush(self):
         """Periodically flush buffer (runs in background thread)"""
-        flush_interval = get_config("quantum_proxy.periodic_flush_interval")
-        while True:
-            time.sleep(flush_interval)  # Wait configured seconds
+        while not self._stop_event.is_set():
+            # Wait configured seconds; a full buffer or stop() wakes this early
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
             with self.lock:
-                if self.buffer:
-                    self._flush_buffer()
+                self._flush_buffer()
+
+    def stop(self):
+        """Stop the periodic flush thread and write out any remaining bits"""
+        self._stop_event.set()
+        self._flush_event.set()
+        if self.flush_thread.is_alive():
+            self.flush_thread.join(timeout=self.thread_join_timeout)
+        if self.flush_thread.is_alive():
+            # A hung write still holds the lock, so a final flush would hang too
+            logger.error(
+                f"❌ Flush thread did not stop within {self.thread_join_timeout}s; "
+                f"{self.bit_count + self.pending_bits} buffered bits not written"
+            )
+            return
+        self.flush()
 
     def get_status(self):
         """Get buffer status"""
         with self.lock:
             return {
-                "buffer_size": len(self.buffer),
+                "buffer_size": self.bit_count + self.pending_bits,
                 "flush_threshold": self.flush_threshold,
                 "data_dir": self.data_dir,
             }
 
 
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider that serializes responses with orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype="application/json")
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+
+# Read once at import rather than on every /bits request
+MAX_BITS_PER_REQUEST = get_config("quantum_proxy.max_bits_per_request")
+
+# /bit bodies are serialized once, indexed by the bit value
+BIT_RESPONSE_BODIES = tuple(
+    orjson.dumps({"bit": bit, "data_type": "quantum"}) for bit in (0, 1)
+)
 
 # Initialize quantum data buffer
 quantum_buffer = QuantumDataBuffer()
+atexit.register(quantum_buffer.stop)
 
 # Initialize quantum cache
 try:
@@ -121,24 +196,43 @@ except Exception as e:
     quantum_cache = None
 
 
+# Static bodies for the API information and 404 responses
+INDEX_RESPONSE_BODY = orjson.dumps(
+    {
+        "name": "Quantum Random Number Generator",
+        "description": "Provides quantum random bits",
+        "version": "2.0.0",
+        "data_type": "QUANTUM",
+        "endpoints": {
+            "/bit": "Get single quantum bit",
+            "/bits?count=N": "Get N quantum bits",
+            "/bits?count=N&format=raw": "Get N quantum bits packed into bytes (MSB first)",
+            "/status": "Get cache status",
+            "/stats": "Get statistics",
+            "/bit-stats": "Get bit distribution statistics",
+        },
+    }
+)
+NOT_FOUND_RESPONSE_BODY = orjson.dumps(
+    {
+        "error": "Endpoint not found",
+        "available_endpoints": [
+            "/bit - Get single quantum bit",
+            "/bits?count=N - Get N quantum bits",
+            "/bits?count=N&format=raw - Get N quantum bits packed into bytes",
+            "/status - Get cache status",
+            "/stats - Get statistics",
+            "/bit-stats - Get bit distribution statistics",
+            "/reset-stats - Reset statistics",
+        ],
+    }
+)
+
+
 @app.route("/")
 def index():
     """API information"""
-    return jsonify(
-        {
-            "name": "Quantum Random Number Generator",
-            "description": "Provides quantum random bits",
-            "version": "2.0.0",
-            "data_type": "QUANTUM",
-            "endpoints": {
-                "/bit": "Get single quantum bit",
-                "/bits?count=N": "Get N quantum bits",
-                "/status": "Get cache status",
-                "/stats": "Get statistics",
-                "/bit-stats": "Get bit distribution statistics",
-            },
-        }
-    )
+    return app.response_class(INDEX_RESPONSE_BODY, mimetype="application/json")
 
 
 @app.route("/bit")
@@ -153,7 +247,7 @@ def get_bit():
         # Add to collection buffer for uploading with actual fetch timestamp
         quantum_buffer.add_bit(bit, fetch_timestamp)
 
-        return jsonify({"bit": bit, "data_type": "quantum"})
+        return app.response_class(BIT_RESPONSE_BODIES[bit], mimetype="application/json")
     except QuantumDataException as e:
         logger.error(f"Quantum data error: {e}")
         return jsonify(
@@ -179,19 +273,29 @@ def get_bits():
 
     try:
         count = int(request.args.get("count", 1))
-        max_bits = get_config("quantum_proxy.max_bits_per_request")
-        if count <= 0 or count > max_bits:
-            return jsonify({"error": f"Invalid count. Must be 1-{max_bits}"}), 400
-
-        bits = []
-        for _ in range(count):
-            bit, fetch_timestamp = quantum_cache.get_bit_with_timestamp()
-            bits.append(bit)
-
-            # Add each bit to collection buffer for uploading with actual fetch timestamp
-            quantum_buffer.add_bit(bit, fetch_timestamp)
+        if count <= 0 or count > MAX_BITS_PER_REQUEST:
+            return jsonify(
+                {"error": f"Invalid count. Must be 1-{MAX_BITS_PER_REQUEST}"}
+            ), 400
+
+        # One slice per cache buffer the request draws from
+        runs = quantum_cache.get_bits_with_timestamps(count)
+
+        # Add each run to collection buffer for uploading with actual fetch timestamp
+        for chunk, fetch_timestamp in runs:
+            quantum_buffer.add_bits(chunk, fetch_timestamp)
+        bits = runs[0][0] if len(runs) == 1 else b"".join(chunk for chunk, _ in runs)
+
+        if request.args.get("format") == "raw":
+            # Pack 8 bits per byte; the bit count disambiguates trailing padding
+            payload = np.packbits(np.frombuffer(bits, dtype=np.uint8)).tobytes()
+            return app.response_class(
+                payload,
+                mimetype="application/octet-stream",
+                headers={"X-Bit-Count": str(len(bits))},
+            )
 
-        return jsonify({"bits": bits, "count": len(bits), "data_type": "quantum"})
+        return jsonify({"bits": list(bits), "count": len(bits), "data_type": "quantum"})
     except QuantumDataException as e:
         logger.error(f"Quantum data error: {e}")
         return jsonify(
@@ -267,19 +371,9 @@ def reset_stats():
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify(
-        {
-            "error": "Endpoint not found",
-            "available_endpoints": [
-                "/bit - Get single quantum bit",
-                "/bits?count=N - Get N quantum bits",
-                "/status - Get cache status",
-                "/stats - Get statistics",
-                "/bit-stats - Get bit distribution statistics",
-                "/reset-stats - Reset statistics",
-            ],
-        }
-    ), 404
+    return app.response_class(
+        NOT_FOUND_RESPONSE_BODY, status=404, mimetype="application/json"
+    )
 
 
 if __name__ == "__main__":
@@ -289,6 +383,9 @@ if __name__ == "__main__":
     logger.info("Available endpoints:")
     logger.info("  GET  /bit - Get single quantum bit")
     logger.info("  GET  /bits?count=N - Get N quantum bits")
+    logger.info(
+        "  GET  /bits?count=N&format=raw - Get N quantum bits packed into bytes"
+    )
     logger.info("  GET  /status - Get cache status")
     logger.info("  GET  /stats - Get statistics")
     logger.info("  GET  /bit-stats - Get bit distribution statistics")
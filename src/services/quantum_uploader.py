@@ -1,16 +1,20 @@
+import io
 import os
-import time
+import sys
 import threading
+import time
 import logging
-import json
-import glob
+import msgspec
+import numpy as np
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple, Union
 from dotenv import load_dotenv
-from datasets import Dataset, Features, Value
-from huggingface_hub import login
-from dateutil.parser import parse as parse_datetime
+from huggingface_hub import CommitOperationAdd, DatasetCard, HfApi, login
+from huggingface_hub.utils import EntryNotFoundError
 from src.config.config_loader import get_quantum_uploader_config, get_config
+from src.core.bit_records import BIT_FILE_SUFFIX, decode_bit_records
 
 # Load environment variables
 load_dotenv(override=True)
@@ -23,6 +27,65 @@ logger = logging.getLogger(__name__)
 
 # Constants
 BITS_PER_UINT32 = 32  # uint32 is always 32 bits by definition
+# Data files written by quantum_proxy.py: packed binary bit records, plus older
+# JSON Lines and legacy JSON array files
+DATA_FILE_PREFIX = "bits_"
+DATA_FILE_SUFFIXES = (BIT_FILE_SUFFIX, ".jsonl", ".json")
+# Legacy JSON array files above this size are stream-parsed to bound memory
+LEGACY_STREAM_THRESHOLD = 4 * 1024 * 1024  # bytes
+# Parquet shard codec: zstd compresses better than the default snappy at similar speed
+PARQUET_COMPRESSION = "zstd"
+PARQUET_COMPRESSION_LEVEL = 3
+# Splits are registered in the dataset card's YAML configs, which is where
+# load_dataset looks for them once any configs exist
+DATASET_CARD_PATH = "README.md"
+DATASET_CONFIG_NAME = "default"
+
+
+class BitRecord(msgspec.Struct):
+    """One quantum bit record as written by quantum_proxy.py"""
+
+    timestamp: Union[str, float]  # ISO-8601 string, or Unix seconds in old files
+    bit: int
+
+
+# Decoders are reusable and typed, so records decode straight into BitRecord
+_RECORD_DECODER = msgspec.json.Decoder(BitRecord)
+_RECORD_LIST_DECODER = msgspec.json.Decoder(List[BitRecord])
+
+
+def _iso_to_unix(timestamp: str) -> int:
+    """Convert an ISO-8601 timestamp as written by quantum_proxy.py to Unix seconds"""
+    # fromisoformat only accepts a trailing "Z" from Python 3.11 on
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+    return int(datetime.fromisoformat(timestamp).timestamp())
+
+
+def _records_to_columns(records: Iterable[BitRecord]) -> Tuple[bytes, np.ndarray]:
+    """Split JSON bit records into (bits, per-bit Unix second timestamps) columns"""
+    bits = bytearray()
+    unix_timestamps: List[int] = []
+    # Bits from one fetch share a timestamp string, so each is parsed once
+    parsed: Dict[str, int] = {}
+    for record in records:
+        bits.append(record.bit)
+        timestamp = record.timestamp
+        if isinstance(timestamp, str):
+            unix_timestamp = parsed.get(timestamp)
+            if unix_timestamp is None:
+                unix_timestamp = parsed[timestamp] = _iso_to_unix(timestamp)
+        else:
+            unix_timestamp = int(timestamp)
+        unix_timestamps.append(unix_timestamp)
+    return bytes(bits), np.array(unix_timestamps, dtype=np.int64)
+
+
+def _concat_column(chunks: List[np.ndarray], dtype: type) -> np.ndarray:
+    """Join column chunks into one array (empty of the given dtype if no chunks)"""
+    if not chunks:
+        return np.empty(0, dtype=dtype)
+    return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
 
 
 class QuantumUploader:
@@ -36,6 +99,9 @@ class QuantumUploader:
         hf_repo: Optional[str] = None,
         data_dir: Optional[str] = None,
         upload_interval: Optional[int] = None,  # seconds between uploads
+        reader_workers: Optional[int] = None,
+        max_files_per_cycle: Optional[int] = None,
+        commit_interval: Optional[int] = None,
     ):
         """
         Initialize quantum uploader
@@ -44,6 +110,9 @@ class QuantumUploader:
             hf_repo: Hugging Face repository name (if None, uses config)
             data_dir: Directory containing data files from quantum_proxy.py (if None, uses config)
             upload_interval: Seconds between uploads (if None, defaults to 1 second)
+            reader_workers: Threads used to read and parse data files (if None, uses config)
+            max_files_per_cycle: Oldest data files read per upload cycle (if None, uses config)
+            commit_interval: Seconds between Hugging Face commits (if None, uses config)
         """
         # Load configuration
         uploader_config = get_quantum_uploader_config()
@@ -52,10 +121,27 @@ class QuantumUploader:
         self.data_dir = data_dir or uploader_config["data_dir"]
         # Override config for optimized uploading: 1 second intervals
         self.upload_interval = upload_interval or 1  # 1 second for real-time streaming
+        self.reader_workers = reader_workers or uploader_config["reader_workers"]
+        self.max_files_per_cycle = (
+            max_files_per_cycle or uploader_config["max_files_per_cycle"]
+        )
+        self.commit_interval = commit_interval or uploader_config["commit_interval"]
+        self.upload_max_retries = uploader_config["upload_max_retries"]
+        if self.upload_max_retries < 1:
+            # With no attempts, cycles would delete staged files never uploaded
+            raise ValueError(
+                f"quantum_uploader.upload_max_retries must be at least 1, got {self.upload_max_retries}"
+            )
+        self.thread_join_timeout = uploader_config["thread_join_timeout"]
+
+        # Reads and parses data files off the upload thread. Created on first
+        # use and shut down by stop(), so the uploader can be restarted.
+        self._io_pool: Optional[ThreadPoolExecutor] = None
 
         # Control flags
         self.running = False
         self.upload_thread = None
+        self._stop_event = threading.Event()
 
         # Statistics
         self.stats = {
@@ -69,9 +155,32 @@ class QuantumUploader:
             "incomplete_batches": 0,  # Batches with < 32 bits
         }
 
-        # Bit accumulator for building uint32 values
-        self.bit_accumulator: List[Dict] = []
+        # Bits not yet packed into a uint32 (one 0/1 byte each) and their Unix
+        # second timestamps. Both are replaced, never mutated, on every update.
+        self.bit_accumulator = bytearray()
+        self.timestamp_accumulator = np.empty(0, dtype=np.int64)
         self.accumulator_lock = threading.Lock()
+        # Serializes read-upload-delete cycles between the worker and manual uploads
+        self._cycle_lock = threading.Lock()
+
+        # uint32 columns packed since the last commit and the files they came
+        # from; the files are only deleted once the commit succeeds
+        self._staged_timestamps: List[np.ndarray] = []
+        self._staged_values: List[np.ndarray] = []
+        self._staged_count = 0
+        self._staged_files: Set[str] = set()
+        self._last_commit = time.monotonic()
+        # After a failed commit round, no commit is attempted before this
+        # monotonic time; the wait doubles per failed round up to commit_interval
+        self._failed_commit_rounds = 0
+        self._next_commit_attempt = 0.0
+
+        # Dataset card as of the last commit, fetched on the first upload
+        self._dataset_card: Optional[DatasetCard] = None
+
+        # Pending file count as of the last directory scan, so status reports
+        # do not have to rescan the data directory
+        self._pending_files = len(self._list_data_files())
 
         # Login to Hugging Face
         self._login_hf()
@@ -80,6 +189,8 @@ class QuantumUploader:
         logger.info(f"   Repository: {self.hf_repo}")
         logger.info(f"   Data Directory: {self.data_dir}")
         logger.info(f"   Upload interval: {self.upload_interval}s")
+        logger.info(f"   Reader workers: {self.reader_workers}")
+        logger.info(f"   Max files per cycle: {self.max_files_per_cycle}")
         logger.info(f"   Bits per uint32: {BITS_PER_UINT32} (uint32 format)")
         logger.info("   📦 32 quantum bits → 1 uint32 value per second")
 
@@ -91,159 +202,416 @@ class QuantumUploader:
 
         try:
             login(token=hf_token)
+            # One client for every upload so its HTTP connections are reused
+            self.api = HfApi(token=hf_token)
             logger.info("✅ Successfully logged in to Hugging Face")
         except Exception as e:
             logger.error(f"❌ Failed to login to Hugging Face: {e}")
             raise
 
-    def _bits_to_uint32(self, bits: List[int]) -> int:
+        # create_commit does not create a missing repository, so make sure it
+        # exists before the first commit
+        try:
+            self.api.create_repo(self.hf_repo, repo_type="dataset", exist_ok=True)
+        except Exception as e:
+            logger.error(f"❌ Failed to create dataset repository {self.hf_repo}: {e}")
+            raise
+
+    def _bits_to_uint32(self, bits: bytes) -> np.ndarray:
         """
-        Convert list of 32 bits to uint32 integer
+        Convert consecutive groups of 32 bits to uint32 integers
 
         Args:
-            bits: List of 32 bits (0 or 1)
+            bits: Multiple of 32 bits, one 0/1 byte per bit
 
         Returns:
-            uint32 integer value
+            uint32 array, one value per 32 bits
         """
-        if len(bits) != 32:
-            raise ValueError(f"Expected 32 bits, got {len(bits)}")
-
-        uint32_value = 0
-        for i, bit in enumerate(bits):
-            if bit:
-                uint32_value |= 1 << (31 - i)  # MSB first
+        if len(bits) % BITS_PER_UINT32:
+            raise ValueError(f"Expected a multiple of 32 bits, got {len(bits)}")
 
-        return uint32_value
+        # Pack 8 bits per byte (MSB first), then read each 4 bytes as a big-endian uint32
+        packed = np.packbits(np.frombuffer(bits, dtype=np.uint8))
+        return packed.view(">u4").astype(np.uint32)
 
-    def _read_and_accumulate_bits(self) -> List[Dict]:
+    def _read_and_accumulate_bits(self) -> Tuple[np.ndarray, np.ndarray, List[str]]:
         """
         Read available data files and accumulate bits for uint32 packing
-        Returns list of uint32 data points ready for upload
+        Returns (timestamps, uint32 values) columns ready for upload, plus the
+        files they were read from. Files are left on disk until the upload succeeds,
+        and files already staged for the next commit are skipped.
         """
-        uint32_data_points = []
+        # Packed columns are collected per file and concatenated once at the end
+        timestamp_chunks: List[np.ndarray] = []
+        value_chunks: List[np.ndarray] = []
+        read_files: List[str] = []
 
         try:
-            # Find all JSON files in data directory
-            pattern = os.path.join(self.data_dir, "bits_*.json")
-            files = glob.glob(pattern)
+            files = self._list_data_files()
+            self._pending_files = len(files)
+            files = [f for f in files if f not in self._staged_files]
 
             if not files:
                 logger.debug(f"📭 No data files found in {self.data_dir}")
-                return []
+                return (
+                    np.empty(0, dtype=np.int64),
+                    np.empty(0, dtype=np.uint32),
+                    read_files,
+                )
+
+            # Bound memory after a backlog: take the oldest files that fit
+            # alongside those already staged and leave the rest for later cycles
+            files = files[: self.max_files_per_cycle - len(self._staged_files)]
 
-            # Process files in chronological order
-            files.sort()
+            # Load files concurrently but consume them in order, so bits are
+            # still packed chronologically
+            futures = [
+                self._get_io_pool().submit(self._load_data_file, filepath)
+                for filepath in files
+            ]
 
-            for filepath in files:
+            for filepath, future in zip(files, futures):
                 try:
-                    with open(filepath, "r") as f:
-                        file_data = json.load(f)
-
-                    if isinstance(file_data, list):
-                        with self.accumulator_lock:
-                            # Add bits to accumulator
-                            self.bit_accumulator.extend(file_data)
-
-                            # Process complete uint32 batches
-                            while len(self.bit_accumulator) >= BITS_PER_UINT32:
-                                # Take first 32 bits
-                                batch_bits = self.bit_accumulator[:BITS_PER_UINT32]
-                                self.bit_accumulator = self.bit_accumulator[
-                                    BITS_PER_UINT32:
-                                ]
-
-                                # Convert to uint32
-                                bits_only = [item["bit"] for item in batch_bits]
-                                uint32_value = self._bits_to_uint32(bits_only)
-
-                                # Use timestamp from first bit in the batch
-                                first_bit_timestamp = batch_bits[0]["timestamp"]
-                                # Convert ISO timestamp to Unix timestamp
-                                if isinstance(first_bit_timestamp, str):
-                                    dt = parse_datetime(first_bit_timestamp)
-                                    unix_timestamp = int(dt.timestamp())
-                                else:
-                                    unix_timestamp = int(first_bit_timestamp)
-
-                                uint32_data_points.append(
-                                    {
-                                        "timestamp": unix_timestamp,
-                                        "uint32_value": uint32_value,
-                                    }
-                                )
-
-                        # Delete processed file
-                        os.remove(filepath)
-                        logger.debug(
-                            f"📄 Processed and removed {os.path.basename(filepath)}"
+                    file_bits, file_timestamps = future.result()
+
+                    with self.accumulator_lock:
+                        # Add bits to accumulator
+                        bits = self.bit_accumulator + file_bits
+                        bit_timestamps = np.concatenate(
+                            (self.timestamp_accumulator, file_timestamps)
                         )
 
-                    else:
-                        logger.warning(f"⚠️ Invalid data format in {filepath}")
+                        # Pack every complete uint32 batch in one call, using
+                        # the timestamp of the first bit in each batch
+                        usable = len(bits) // BITS_PER_UINT32 * BITS_PER_UINT32
+                        if usable:
+                            value_chunks.append(
+                                self._bits_to_uint32(bytes(bits[:usable]))
+                            )
+                            timestamp_chunks.append(
+                                bit_timestamps[:usable:BITS_PER_UINT32]
+                            )
+
+                        self.bit_accumulator = bits[usable:]
+                        self.timestamp_accumulator = bit_timestamps[usable:]
+
+                    read_files.append(filepath)
+                    logger.debug(f"📄 Processed {os.path.basename(filepath)}")
 
                 except Exception as e:
                     logger.error(f"❌ Error processing file {filepath}: {e}")
                     self.stats["file_errors"] += 1
 
-            if uint32_data_points:
-                logger.info(
-                    f"✅ Packed {len(uint32_data_points)} uint32 values from quantum bits"
-                )
-
         except Exception as e:
             logger.error(f"❌ Error reading and accumulating bits: {e}")
             self.stats["file_errors"] += 1
 
-        return uint32_data_points
+        timestamps = _concat_column(timestamp_chunks, np.int64)
+        uint32_values = _concat_column(value_chunks, np.uint32)
+        if len(uint32_values):
+            logger.info(
+                f"✅ Packed {len(uint32_values)} uint32 values from quantum bits"
+            )
+
+        return timestamps, uint32_values, read_files
+
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """Return the file I/O pool, creating it if needed (called within a cycle)"""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=self.reader_workers, thread_name_prefix="uploader-io"
+            )
+        return self._io_pool
+
+    def _delete_data_files(self, filepaths: List[str]):
+        """Remove data files whose bits have been uploaded"""
+        # Removals are independent, so run them on the I/O pool; on network
+        # filesystems each one is a round trip
+        io_pool = self._get_io_pool()
+        futures = [io_pool.submit(os.remove, filepath) for filepath in filepaths]
+        for filepath, future in zip(filepaths, futures):
+            try:
+                future.result()
+                self._pending_files -= 1
+                self.stats["total_files_processed"] += 1
+            except OSError as e:
+                logger.error(f"❌ Failed to remove {filepath}: {e}")
+                self.stats["file_errors"] += 1
+
+    def _list_data_files(self) -> List[str]:
+        """List pending data files in chronological (filename) order"""
+        # One directory pass; name checks avoid glob's per-entry pattern matching
+        try:
+            with os.scandir(self.data_dir) as entries:
+                files = [
+                    (entry.name, entry.path)
+                    for entry in entries
+                    if entry.name.startswith(DATA_FILE_PREFIX)
+                    and entry.name.endswith(DATA_FILE_SUFFIXES)
+                ]
+        except FileNotFoundError:
+            return []
+        files.sort()
+        return [path for _, path in files]
+
+    def _load_data_file(self, filepath: str) -> Tuple[bytes, np.ndarray]:
+        """
+        Load a binary, JSON Lines or legacy JSON array file as bits (one 0/1
+        byte per bit) and their per-bit Unix second timestamps
+        """
+        with open(filepath, "rb") as f:
+            if filepath.endswith(BIT_FILE_SUFFIX):
+                records = decode_bit_records(f.read())
+                if not records:
+                    return b"", np.empty(0, dtype=np.int64)
+                bits = b"".join(record_bits for _, record_bits in records)
+                unix_timestamps = np.repeat(
+                    np.array([ts_us // 1_000_000 for ts_us, _ in records], np.int64),
+                    [len(record_bits) for _, record_bits in records],
+                )
+                return bits, unix_timestamps
+
+            if filepath.endswith(".json"):
+                if os.fstat(f.fileno()).st_size > LEGACY_STREAM_THRESHOLD:
+                    # Only needed for large leftover arrays, so import on demand
+                    import ijson
+
+                    return _records_to_columns(
+                        BitRecord(timestamp=item["timestamp"], bit=int(item["bit"]))
+                        for item in ijson.items(f, "item", use_float=True)
+                    )
+                return _records_to_columns(_RECORD_LIST_DECODER.decode(f.read()))
+
+            # One record per line
+            return _records_to_columns(_RECORD_DECODER.decode_lines(f.read()))
 
-    def _upload_uint32_data(self, uint32_data_points: List[Dict]):
-        """Upload uint32 data points to Hugging Face"""
-        if not uint32_data_points:
+    def _upload_uint32_data(self, timestamps: np.ndarray, uint32_values: np.ndarray):
+        """Upload uint32 values and their Unix timestamps to Hugging Face"""
+        if not len(uint32_values):
             logger.debug("📭 No uint32 data to upload")
             return
 
+        # pyarrow is slow to import, so load it on first upload
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
         try:
             logger.info(
-                f"📤 Uploading {len(uint32_data_points)} uint32 values to Hugging Face..."
+                f"📤 Uploading {len(uint32_values)} uint32 values to Hugging Face..."
             )
 
-            # Define dataset features for optimized storage
-            features = Features(
+            # Build the Arrow table straight from the columns
+            table = pa.table(
                 {
-                    "timestamp": Value("int64"),  # Unix timestamp (seconds since 1970)
-                    "uint32_value": Value(
-                        "uint32"
-                    ),  # 32 quantum bits packed as single uint32
+                    # Unix timestamp (seconds since 1970)
+                    "timestamp": pa.array(timestamps, type=pa.int64()),
+                    # 32 quantum bits packed as single uint32
+                    "uint32_value": pa.array(uint32_values, type=pa.uint32()),
                 }
             )
 
-            # Create dataset
-            dataset = Dataset.from_list(uint32_data_points, features=features)
-
-            # Determine split name (date and hour) for organization
+            # One clock read per upload names the split (date and hour) and shard
+            # and stamps the statistics
             now = datetime.now(timezone.utc)
-            split_name = f"uint32_{now.strftime('%Y%m%d_%H')}"
+            split_name = f"uint32_{now:%Y%m%d_%H}"
+
+            # Serialize to zstd-compressed Parquet in memory. Only timestamps
+            # repeat, so the random uint32 values skip dictionary encoding.
+            parquet_buffer = io.BytesIO()
+            pq.write_table(
+                table,
+                parquet_buffer,
+                compression=PARQUET_COMPRESSION,
+                compression_level=PARQUET_COMPRESSION_LEVEL,
+                use_dictionary=["timestamp"],
+            )
+
+            # Each upload adds a uniquely named shard to its split instead of
+            # replacing the files pushed earlier in the same hour. Shards are
+            # nested by day to keep every Hub directory small.
+            shard_dir = f"data/{now:%Y%m%d}"
+            shard_id = f"{now:%M%S}-{uuid.uuid4().hex[:8]}"
+            shard_path = f"{shard_dir}/{split_name}-{shard_id}.parquet"
+            operations = [
+                CommitOperationAdd(
+                    path_in_repo=shard_path,
+                    path_or_fileobj=parquet_buffer.getvalue(),
+                )
+            ]
 
-            # Upload to Hugging Face
-            dataset.push_to_hub(self.hf_repo, split=split_name)
+            # The first shard of a split also registers it in the dataset card,
+            # in the same commit so the split never exists unlisted
+            updated_card = self._card_with_split(
+                split_name, f"{shard_dir}/{split_name}-*"
+            )
+            if updated_card is not None:
+                operations.append(
+                    CommitOperationAdd(
+                        path_in_repo=DATASET_CARD_PATH,
+                        path_or_fileobj=str(updated_card).encode(),
+                    )
+                )
+
+            self.api.create_commit(
+                repo_id=self.hf_repo,
+                repo_type="dataset",
+                operations=operations,
+                commit_message=f"Upload {len(uint32_values)} uint32 values to {split_name}",
+            )
+            if updated_card is not None:
+                self._dataset_card = updated_card
 
             # Update statistics
             self.stats["total_uploads"] += 1
-            self.stats["total_uint32_uploaded"] += len(uint32_data_points)
-            self.stats["total_bits_uploaded"] += len(uint32_data_points) * 32
-            self.stats["last_upload_time"] = int(time.time())  # Unix timestamp
+            self.stats["total_uint32_uploaded"] += len(uint32_values)
+            self.stats["total_bits_uploaded"] += len(uint32_values) * 32
+            self.stats["last_upload_time"] = int(now.timestamp())  # Unix timestamp
 
             logger.info(
-                f"✅ Successfully uploaded {len(uint32_data_points)} uint32 values to split '{split_name}'"
+                f"✅ Successfully uploaded {len(uint32_values)} uint32 values to split '{split_name}'"
             )
-            logger.info(f"   📊 Total bits represented: {len(uint32_data_points) * 32}")
+            logger.info(f"   📊 Total bits represented: {len(uint32_values) * 32}")
 
         except Exception as e:
             logger.error(f"❌ Failed to upload uint32 data: {e}")
             self.stats["upload_errors"] += 1
             raise
 
+    def _card_with_split(
+        self, split_name: str, data_files: str
+    ) -> Optional[DatasetCard]:
+        """
+        Return a copy of the dataset card with split_name added to the default
+        config's data_files, or None if the split is already listed with that
+        path and the card needs no other change
+        """
+        if self._dataset_card is None:
+            try:
+                self._dataset_card = DatasetCard.load(
+                    self.hf_repo, repo_type="dataset", token=self.api.token
+                )
+            except EntryNotFoundError:
+                # New repository without a README yet
+                self._dataset_card = DatasetCard("---\n{}\n---\n")
+
+        # Work on a copy so a failed commit leaves the cached card unchanged
+        card = DatasetCard(str(self._dataset_card))
+        configs = card.data.get("configs") or []
+        config = next(
+            (c for c in configs if c.get("config_name") == DATASET_CONFIG_NAME), None
+        )
+        if config is None:
+            config = {"config_name": DATASET_CONFIG_NAME, "data_files": []}
+            configs.append(config)
+
+        # dataset_info from an earlier push_to_hub lists per-split example
+        # counts, which every appended shard makes stale, and load_dataset
+        # verifies them. The counts are not tracked here, so drop the block.
+        stale_info = card.data.pop("dataset_info", None) is not None
+
+        split_files = config.get("data_files") or []
+        entry = next(
+            (
+                e
+                for e in split_files
+                if isinstance(e, dict) and e.get("split") == split_name
+            ),
+            None,
+        )
+        if entry is not None:
+            # A split pushed before shards were nested by day lists only its
+            # flat path; add the nested one so new shards are loaded too
+            paths = entry.get("path") or []
+            paths = [paths] if isinstance(paths, str) else list(paths)
+            if data_files in paths:
+                return card if stale_info else None
+            entry["path"] = paths + [data_files]
+            card.data["configs"] = configs
+            return card
+
+        split_files.append({"split": split_name, "path": data_files})
+        config["data_files"] = split_files
+        card.data["configs"] = configs
+        return card
+
+    def _upload_with_retry(self, timestamps: np.ndarray, uint32_values: np.ndarray):
+        """Upload uint32 data, retrying transient failures with exponential backoff"""
+        for attempt in range(self.upload_max_retries):
+            try:
+                self._upload_uint32_data(timestamps, uint32_values)
+                return
+            except Exception:
+                # Give up early on shutdown; the files stay for the next run
+                if attempt == self.upload_max_retries - 1 or self._stop_event.is_set():
+                    raise
+
+            max_backoff = get_config("quantum_uploader.upload_backoff_max")
+            wait_time = min(2**attempt, max_backoff)
+            logger.info(
+                f"⏳ Retrying upload in {wait_time}s "
+                f"(attempt {attempt + 2}/{self.upload_max_retries})..."
+            )
+            self._stop_event.wait(wait_time)
+
+    def _upload_cycle(self, force: bool = False) -> int:
+        """
+        Pack pending data files into uint32 values and stage them. Once
+        commit_interval has passed, max_files_per_cycle files are staged, or
+        when forced, upload everything staged in one commit, then delete the
+        staged files. On a failed upload the values and files stay staged, so
+        a later cycle retries the same bits after a backoff.
+        Returns the number of uint32 values uploaded.
+        """
+        with self._cycle_lock:
+            timestamps, uint32_values, read_files = self._read_and_accumulate_bits()
+            if len(uint32_values):
+                self._staged_timestamps.append(timestamps)
+                self._staged_values.append(uint32_values)
+                self._staged_count += len(uint32_values)
+            self._staged_files.update(read_files)
+
+            # Commit early once a backlog has staged a full cycle's worth of
+            # files, so staged memory stays bounded by max_files_per_cycle,
+            # but never before the backoff after a failed round has passed
+            now = time.monotonic()
+            if not force and (
+                now < self._next_commit_attempt
+                or (
+                    len(self._staged_files) < self.max_files_per_cycle
+                    and now - self._last_commit < self.commit_interval
+                )
+            ):
+                return 0
+
+            uploaded = self._staged_count
+            if uploaded:
+                try:
+                    self._upload_with_retry(
+                        _concat_column(self._staged_timestamps, np.int64),
+                        _concat_column(self._staged_values, np.uint32),
+                    )
+                except Exception:
+                    self._failed_commit_rounds += 1
+                    max_backoff = get_config("quantum_uploader.upload_backoff_max")
+                    wait_time = min(
+                        max_backoff * 2 ** (self._failed_commit_rounds - 1),
+                        self.commit_interval,
+                    )
+                    self._next_commit_attempt = time.monotonic() + wait_time
+                    logger.warning(
+                        f"⏳ Commit failed; keeping files staged and retrying in {wait_time}s"
+                    )
+                    raise
+                self._failed_commit_rounds = 0
+
+            self._delete_data_files(list(self._staged_files))
+            self._staged_timestamps = []
+            self._staged_values = []
+            self._staged_count = 0
+            self._staged_files = set()
+            self._last_commit = time.monotonic()
+            return uploaded
+
     def _upload_worker(self):
         """Worker thread for high-frequency uploads (every second)"""
         logger.info(
@@ -252,22 +620,15 @@ class QuantumUploader:
 
         while self.running:
             try:
-                # Read and accumulate bits into uint32 values
-                uint32_data_points = self._read_and_accumulate_bits()
-
-                if uint32_data_points:
-                    self._upload_uint32_data(uint32_data_points)
-                else:
-                    logger.debug("📭 No complete uint32 batches ready for upload")
+                # Read and accumulate bits into uint32 values, then upload
+                if not self._upload_cycle():
+                    logger.debug("📭 Nothing committed this cycle")
 
             except Exception as e:
                 logger.error(f"❌ Upload worker error: {e}")
 
-            # Wait for next upload cycle (1 second)
-            for _ in range(self.upload_interval):
-                if not self.running:
-                    break
-                time.sleep(1)
+            # Wait for next upload cycle; stop() wakes this immediately
+            self._stop_event.wait(self.upload_interval)
 
         logger.info("🛑 High-frequency upload scheduler stopped")
 
@@ -281,6 +642,7 @@ class QuantumUploader:
         os.makedirs(self.data_dir, exist_ok=True)
 
         self.running = True
+        self._stop_event.clear()
 
         # Start upload thread
         self.upload_thread = threading.Thread(target=self._upload_worker, daemon=True)
@@ -296,39 +658,36 @@ class QuantumUploader:
 
         logger.info("🛑 Stopping QuantumUploader...")
         self.running = False
+        self._stop_event.set()
 
         # Wait for thread to finish
         if self.upload_thread and self.upload_thread.is_alive():
-            thread_timeout = get_config("quantum_uploader.thread_join_timeout")
-            self.upload_thread.join(timeout=thread_timeout)
+            self.upload_thread.join(timeout=self.thread_join_timeout)
 
         # Upload any remaining data
         try:
-            uint32_data_points = self._read_and_accumulate_bits()
-            if uint32_data_points:
-                self._upload_uint32_data(uint32_data_points)
+            self._upload_cycle(force=True)
         except Exception as e:
             logger.error(f"❌ Error during final upload: {e}")
 
+        with self._cycle_lock:
+            if self._io_pool is not None:
+                self._io_pool.shutdown(wait=True)
+                self._io_pool = None
+
         logger.info("✅ QuantumUploader stopped")
 
     def get_status(self) -> Dict[str, Any]:
         """Get uploader status"""
-        # Count pending files
-        try:
-            pattern = os.path.join(self.data_dir, "bits_*.json")
-            pending_files = len(glob.glob(pattern))
-        except:  # noqa: E722
-            pending_files = 0
-
         # Count bits in accumulator
         with self.accumulator_lock:
             accumulated_bits = len(self.bit_accumulator)
 
         return {
             "running": self.running,
-            "pending_files": pending_files,
+            "pending_files": self._pending_files,
             "accumulated_bits": accumulated_bits,
+            "staged_uint32_values": self._staged_count,
             "bits_needed_for_next_uint32": BITS_PER_UINT32
             - (accumulated_bits % BITS_PER_UINT32),
             "stats": self.stats.copy(),
@@ -345,6 +704,7 @@ class QuantumUploader:
         print(f"🔄 Running: {'✅ Yes' if status['running'] else '❌ No'}")
         print(f"📂 Pending Files: {status['pending_files']}")
         print(f"🔢 Accumulated Bits: {status['accumulated_bits']}")
+        print(f"🗂️ Staged uint32 Values: {status['staged_uint32_values']}")
         print(
             f"⏳ Bits needed for next uint32: {status['bits_needed_for_next_uint32']}"
         )
@@ -370,7 +730,8 @@ class QuantumUploader:
 
         print("\n💡 OPTIMIZATION INFO:")
         print("   • 32 quantum bits = 1 uint32 value")
-        print(f"   • Upload frequency: Every {self.upload_interval} second(s)")
+        print(f"   • Read frequency: Every {self.upload_interval} second(s)")
+        print(f"   • Commit frequency: Every {self.commit_interval} second(s)")
         print("   • Data format: Unix timestamp + uint32 quantum value")
         print("   • Storage efficiency: ~87.5% reduction vs individual bits")
 
@@ -380,9 +741,7 @@ class QuantumUploader:
         """Manually trigger an upload"""
         logger.info("🔄 Manual upload triggered...")
         try:
-            uint32_data_points = self._read_and_accumulate_bits()
-            if uint32_data_points:
-                self._upload_uint32_data(uint32_data_points)
+            if self._upload_cycle(force=True):
                 logger.info("✅ Manual upload completed")
             else:
                 logger.info("📭 No complete uint32 batches available for manual upload")
@@ -411,17 +770,22 @@ def main():
         print("🌌 Quantum Data Uploader (Optimized Mode)")
         print("=" * 60)
         print("📦 Collecting 32 quantum bits → 1 uint32 value every second")
-        print("⏰ High-frequency uploads (1 second intervals)")
+        print(
+            f"⏰ Files read every {uploader.upload_interval}s, "
+            f"committed every {uploader.commit_interval}s"
+        )
         print("📊 Unix timestamps for efficient storage")
         print("💡 Press Ctrl+C to stop")
         print("=" * 60)
 
-        # Print status every 30 seconds (more frequent for real-time monitoring)
-        status_interval = get_config("quantum_uploader.status_display_interval", 30)
-
-        while True:
-            time.sleep(status_interval)
-            uploader.print_status()
+        # Print status every 30 seconds (more frequent for real-time monitoring),
+        # but only to an interactive terminal; headless runs just wait for stop
+        if sys.stdout.isatty():
+            status_interval = get_config("quantum_uploader.status_display_interval", 30)
+            while not uploader._stop_event.wait(status_interval):
+                uploader.print_status()
+        else:
+            uploader._stop_event.wait()
 
     except KeyboardInterrupt:
         logger.info("🛑 Received interrupt signal...")
@@ -0,0 +1,3 @@
+"""
+Tests for the Global Consciousness quantum data pipeline
+"""
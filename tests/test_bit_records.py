@@ -0,0 +1,58 @@
+"""
+Round-trip tests for the binary bit file format in src/core/bit_records.py
+"""
+
+import unittest
+
+from src.core.bit_records import (
+    BIT_RECORD_HEADER,
+    decode_bit_records,
+    encode_bit_records,
+)
+
+
+class BitRecordsTest(unittest.TestCase):
+    def assertRoundTrip(self, records):
+        self.assertEqual(decode_bit_records(encode_bit_records(records)), records)
+
+    def test_empty_file(self):
+        self.assertEqual(encode_bit_records([]), b"")
+        self.assertEqual(decode_bit_records(b""), [])
+
+    def test_empty_run(self):
+        data = encode_bit_records([(1_700_000_000_000_000, b"")])
+        self.assertEqual(len(data), BIT_RECORD_HEADER.size)
+        self.assertRoundTrip([(1_700_000_000_000_000, b"")])
+
+    def test_bit_counts_not_a_multiple_of_eight(self):
+        for count in (1, 7, 9, 15, 33):
+            with self.subTest(count=count):
+                bits = bytes(i % 3 % 2 for i in range(count))
+                data = encode_bit_records([(123, bits)])
+                # Padding only fills the last byte
+                self.assertEqual(len(data), BIT_RECORD_HEADER.size + (count + 7) // 8)
+                self.assertRoundTrip([(123, bits)])
+
+    def test_bits_packed_most_significant_first(self):
+        data = encode_bit_records([(0, b"\x01\x00\x00\x00\x00\x00\x00\x01\x01")])
+        self.assertEqual(data[BIT_RECORD_HEADER.size :], b"\x81\x80")
+
+    def test_multiple_records(self):
+        records = [
+            (1_700_000_000_000_000, b"\x01\x00\x01"),
+            (1_700_000_000_500_000, b""),
+            (1_700_000_001_000_000, bytes(i % 2 for i in range(1000))),
+            (2**64 - 1, b"\x01" * 8),
+        ]
+        self.assertRoundTrip(records)
+
+    def test_truncated_trailing_record(self):
+        data = encode_bit_records([(1, b"\x01" * 16), (2, b"\x00\x01" * 12)])
+        for cut in (1, 2, BIT_RECORD_HEADER.size + 1):
+            with self.subTest(cut=cut):
+                with self.assertRaises(ValueError):
+                    decode_bit_records(data[:-cut])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Tests for staging and deleting data files in src/services/quantum_uploader.py
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from huggingface_hub import DatasetCard
+
+from src.core.bit_records import encode_bit_records
+from src.services.quantum_uploader import QuantumUploader
+
+
+class FakeApi:
+    """Stands in for HfApi, recording commits or failing them on request"""
+
+    def __init__(self):
+        self.token = "test"
+        self.fail = False
+        self.commits = []
+
+    def create_commit(self, **kwargs):
+        if self.fail:
+            raise OSError("Hub unavailable")
+        self.commits.append(kwargs)
+
+
+class UploadCycleTest(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.data_dir.cleanup)
+        self.api = FakeApi()
+
+        def fake_login(uploader):
+            uploader.api = self.api
+
+        with mock.patch.object(QuantumUploader, "_login_hf", fake_login):
+            self.uploader = QuantumUploader(
+                data_dir=self.data_dir.name, commit_interval=3600
+            )
+        self.addCleanup(self.uploader.stop)
+        self.uploader.running = True  # so stop() shuts down the I/O pool
+        self.uploader.upload_max_retries = 1
+        # Skip fetching the card from the Hub
+        self.uploader._dataset_card = DatasetCard("---\n{}\n---\n")
+
+    def write_data_file(self, name: str) -> str:
+        filepath = os.path.join(self.data_dir.name, name)
+        with open(filepath, "wb") as f:
+            f.write(encode_bit_records([(1_700_000_000_000_000, b"\x01\x00" * 32)]))
+        return filepath
+
+    def test_files_kept_until_commit_succeeds(self):
+        first = self.write_data_file("bits_20240101_000000_000000.bin")
+        second = self.write_data_file("bits_20240101_000001_000000.bin")
+        load = mock.patch.object(
+            self.uploader, "_load_data_file", wraps=self.uploader._load_data_file
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+
+        self.api.fail = True
+        with self.assertRaises(OSError):
+            self.uploader._upload_cycle(force=True)
+        self.assertTrue(os.path.exists(first))
+        self.assertTrue(os.path.exists(second))
+        self.assertEqual(self.uploader._staged_files, {first, second})
+        self.assertEqual(self.uploader._staged_count, 4)
+        self.assertEqual(load.call_count, 2)
+
+        # A later failed cycle neither re-reads nor removes the staged files
+        with self.assertRaises(OSError):
+            self.uploader._upload_cycle(force=True)
+        self.assertEqual(load.call_count, 2)
+        self.assertEqual(self.uploader._staged_count, 4)
+        self.assertTrue(os.path.exists(first))
+
+        third = self.write_data_file("bits_20240101_000002_000000.bin")
+        self.api.fail = False
+        self.assertEqual(self.uploader._upload_cycle(force=True), 6)
+        load.assert_called_with(third)
+        self.assertEqual(load.call_count, 3)
+        self.assertEqual(len(self.api.commits), 1)
+        self.assertEqual(os.listdir(self.data_dir.name), [])
+        self.assertEqual(self.uploader._staged_files, set())
+        self.assertEqual(self.uploader._staged_count, 0)
+
+    def test_unforced_cycle_stages_without_committing(self):
+        filepath = self.write_data_file("bits_20240101_000000_000000.bin")
+
+        self.assertEqual(self.uploader._upload_cycle(), 0)
+        self.assertEqual(self.api.commits, [])
+        self.assertTrue(os.path.exists(filepath))
+        self.assertEqual(self.uploader._staged_files, {filepath})
+
+
+if __name__ == "__main__":
+    unittest.main()